@@ -20,6 +20,7 @@ DEFAULT_SETTINGS = {
     "osc_enabled": True,
     "osc_broadcast_port": 9000,  # Порт для отправки OSC-сообщений
     "osc_broadcast_ip": "255.255.255.255",  # IP для отправки OSC-сообщений (широковещательный)
+    "osc_send_bundles": False,  # Объединять пачки исходящих OSC-сообщений в один пакет (bundle)
     "capture_folder": "",  # Папка для записи захватов
     "capture_name": "",    # Имя захвата по умолчанию
     "capture_description": ""  # Описание захвата по умолчанию
@@ -116,6 +117,7 @@ LOG_MAX_LINES = 1000
 MAX_RECONNECT_ATTEMPTS = 10
 BASE_RECONNECT_DELAY = 1
 MAX_RECONNECT_DELAY = 15
+MAX_RECONNECT_TIME = 90  # Общее время на переподключение в секундах
 
 # Названия статусов для понятного отображения
 STATUS_CONNECTED = "Подключено"
@@ -3,19 +3,329 @@
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import os
+import queue
+import sys
 import threading
 import socket
-from datetime import datetime
-from typing import Callable, Any, Optional
+import struct
+import time
+from typing import Any, Callable, Coroutine, Dict, Iterator, List, Optional, Tuple
 from PyQt5.QtCore import QThread, pyqtSignal
 
-from pythonosc import dispatcher, osc_server, udp_client
+from pythonosc import dispatcher, osc_bundle, osc_message, osc_message_builder
 import config
 
+# Максимальное количество исходящих сообщений, отправляемых за один проход
+_SEND_BATCH_SIZE = 64
+# Максимальный размер исходящего OSC bundle
+_MAX_BUNDLE_SIZE = 8192
+# Заголовок OSC bundle с временной меткой "немедленно"
+_BUNDLE_HEADER = b"#bundle\0" + struct.pack(">Q", 1)
+# Размер буфера приема (как max_packet_size у socketserver.UDPServer)
+_RECV_BUFFER_SIZE = 8192
+# Максимальное количество параллельных приемников OSC-сообщений
+_MAX_RECEIVERS = 4
+
+# Кэш префикса с временной меткой для format_osc_message (секунда и готовая строка)
+_LAST_TS_SECOND = 0
+_LAST_TS_PREFIX = ""
+
+
+def _build_message(address: str, value: Any) -> osc_message.OscMessage:
+    """
+    Собирает OSC-сообщение так же, как udp_client.SimpleUDPClient.send_message
+    
+    Args:
+        address: OSC-адрес сообщения
+        value: Значение или список значений
+        
+    Returns:
+        osc_message.OscMessage: Собранное сообщение
+    """
+    builder = osc_message_builder.OscMessageBuilder(address=address)
+    if value is None:
+        values = []
+    elif isinstance(value, (list, tuple)):
+        values = value
+    else:
+        values = [value]
+    for val in values:
+        builder.add_arg(val)
+    return builder.build()
+
+
+# Общие сокеты для отправки OSC-сообщений: адрес назначения -> [сокет, число пользователей]
+_shared_socks_lock = threading.Lock()
+_shared_socks: Dict[Tuple[str, int], list] = {}
+
+
+def _create_broadcast_socket(target: Tuple[str, int]) -> Optional[socket.socket]:
+    """
+    Создает сокет для отправки OSC-сообщений
+    
+    Сокет подключается к адресу назначения, поэтому отправка идет через send()
+    без передачи адреса при каждом вызове.
+    
+    Args:
+        target: IP-адрес и порт назначения
+        
+    Returns:
+        Optional[socket.socket]: Подключенный сокет или None, если создать его не удалось
+    """
+    logger = logging.getLogger('ShogunOSC')
+    target_ip, target_port = target
+    
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        if target_ip == "255.255.255.255":
+            # Разрешаем отправку широковещательных сообщений
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            # Привязываем к любому доступному порту
+            sock.bind(('', 0))
+        sock.connect((target_ip, target_port))
+    except Exception as e:
+        sock.close()
+        logger.error(f"Не удалось создать OSC-клиент: {e}")
+        return None
+    
+    logger.info(f"Создан OSC-клиент для отправки сообщений на {target_ip}:{target_port}")
+    return sock
+
+
+def _acquire_broadcast_socket(target: Tuple[str, int]) -> Optional[socket.socket]:
+    """
+    Возвращает общий сокет для адреса назначения, создавая его при первом обращении
+    
+    Args:
+        target: IP-адрес и порт назначения
+        
+    Returns:
+        Optional[socket.socket]: Подключенный сокет или None, если создать его не удалось
+    """
+    with _shared_socks_lock:
+        entry = _shared_socks.get(target)
+        if entry is None:
+            sock = _create_broadcast_socket(target)
+            if sock is None:
+                return None
+            entry = _shared_socks[target] = [sock, 0]
+        entry[1] += 1
+        return entry[0]
+
+
+def _release_broadcast_socket(target: Tuple[str, int]) -> None:
+    """
+    Освобождает общий сокет и закрывает его, когда он больше никому не нужен
+    
+    Args:
+        target: IP-адрес и порт назначения
+    """
+    with _shared_socks_lock:
+        entry = _shared_socks.get(target)
+        if entry is None:
+            return
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _shared_socks[target]
+            entry[0].close()
+
+
+def _send_once_more_if_refused(send: Callable[[Any], Any], payload: Any) -> None:
+    """
+    Отправляет датаграмму через подключенный сокет, повторяя отправку после ConnectionRefusedError
+    
+    Подключенный UDP-сокет сообщает об ICMP port unreachable для прошлой датаграммы
+    ошибкой следующей отправки, и эта датаграмма не уходит. Ошибка при этом сбрасывается,
+    поэтому достаточно одного повтора (при отправке через sendto ошибки не было вовсе).
+    
+    Args:
+        send: Метод отправки сокета (send или sendmsg)
+        payload: Датаграмма или список буферов
+    """
+    try:
+        send(payload)
+    except ConnectionRefusedError:
+        send(payload)
+
+
+def _bundle_buffers(dgrams: List[bytes]) -> Iterator[List[bytes]]:
+    """
+    Раскладывает OSC-сообщения по пакетам (bundle) не больше _MAX_BUNDLE_SIZE
+    
+    Args:
+        dgrams: Собранные OSC-сообщения
+        
+    Yields:
+        List[bytes]: Буферы одного пакета для отправки через sendmsg
+    """
+    buffers = [_BUNDLE_HEADER]
+    size = len(_BUNDLE_HEADER)
+    for dgram in dgrams:
+        element_size = 4 + len(dgram)
+        if len(buffers) > 1 and size + element_size > _MAX_BUNDLE_SIZE:
+            yield buffers
+            buffers = [_BUNDLE_HEADER]
+            size = len(_BUNDLE_HEADER)
+        buffers.append(struct.pack(">i", len(dgram)))
+        buffers.append(dgram)
+        size += element_size
+    if len(buffers) > 1:
+        yield buffers
+
+
+def _receiver_count() -> int:
+    """
+    Определяет количество параллельных приемников OSC-сообщений
+    
+    Несколько сокетов на одном порту имеют смысл только при наличии SO_REUSEPORT
+    и интерпретаторе без GIL, иначе обработка все равно выполняется по очереди.
+    
+    Returns:
+        int: Количество приемников
+    """
+    if not hasattr(socket, "SO_REUSEPORT"):
+        return 1
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    if is_gil_enabled is None or is_gil_enabled():
+        return 1
+    return max(1, min(_MAX_RECEIVERS, os.cpu_count() or 1))
+
+
+def _pad_osc_string(value: str) -> bytes:
+    """
+    Кодирует строку так, как она записывается в OSC-датаграмме
+    
+    Args:
+        value: Исходная строка
+        
+    Returns:
+        bytes: Строка с завершающим нулем, дополненная до кратной 4 длины
+    """
+    raw = value.encode("utf-8")
+    return raw + b"\0" * (4 - len(raw) % 4)
+
+
+def _osc_string_end(data: memoryview, start: int) -> int:
+    """
+    Находит конец OSC-строки с учетом выравнивания
+    
+    Строка дополняется нулями до кратной 4 длины, поэтому она заканчивается
+    на первом 4-байтовом блоке, последний байт которого равен нулю.
+    
+    Args:
+        data: Содержимое датаграммы
+        start: Смещение начала строки
+        
+    Returns:
+        int: Смещение за концом строки или -1, если строка не завершена
+    """
+    for end in range(start + 4, len(data) + 1, 4):
+        if data[end - 1] == 0:
+            return end
+    return -1
+
+
+def _parse_osc(data: memoryview) -> Optional[Tuple[bytes, Tuple[str, ...]]]:
+    """
+    Упрощенный разбор OSC-сообщения для команд этого сервера
+    
+    Поддерживаются только сообщения без аргументов и с одним строковым аргументом;
+    для всего остального возвращается None и используется полный разбор pythonosc.
+    
+    Args:
+        data: Содержимое датаграммы
+        
+    Returns:
+        Optional[Tuple[bytes, Tuple[str, ...]]]: Адрес (с выравниванием) и аргументы или None
+    """
+    address_end = _osc_string_end(data, 0)
+    if address_end < 0:
+        return None
+    address = bytes(data[:address_end])
+    if address_end == len(data):
+        return address, ()
+    
+    tags_end = _osc_string_end(data, address_end)
+    if tags_end < 0 or data[address_end] != 0x2C:  # ','
+        return None
+    tags = bytes(data[address_end + 1:tags_end]).rstrip(b"\0")
+    if not tags:
+        if tags_end != len(data):
+            return None
+        return address, ()
+    if tags != b"s":
+        return None
+    
+    value_end = _osc_string_end(data, tags_end)
+    if value_end != len(data):
+        return None
+    try:
+        value = bytes(data[tags_end:value_end]).rstrip(b"\0").decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    return address, (value,)
+
+
+# Команды управления Shogun Live: адрес -> (описание, метод ShogunWorker,
+# ошибка при отсутствии аргумента или None для команд без аргумента, ошибка при отсутствии подключения).
+# В описание подставляется значение аргумента через %-форматирование (как в logging).
+_HANDLER_TABLE: Dict[str, Tuple[str, str, Optional[str], str]] = {
+    config.OSC_START_RECORDING: (
+        "Запуск записи", "startcapture", None,
+        "Не удалось запустить запись: нет подключения к Shogun Live"),
+    config.OSC_STOP_RECORDING: (
+        "Остановка записи", "stopcapture", None,
+        "Не удалось остановить запись: нет подключения к Shogun Live"),
+    config.OSC_SET_CAPTURE_NAME: (
+        "Установка имени захвата: '%s'", "set_capture_name", "Отсутствует имя захвата",
+        "Не удалось установить имя захвата: нет подключения к Shogun Live"),
+    config.OSC_SET_CAPTURE_FOLDER: (
+        "Установка папки захвата: '%s'", "set_capture_folder", "Отсутствует путь к папке захвата",
+        "Не удалось установить папку захвата: нет подключения к Shogun Live"),
+    config.OSC_SET_CAPTURE_DESCRIPTION: (
+        "Установка описания захвата", "set_capture_description", "Отсутствует описание захвата",
+        "Не удалось установить описание захвата: нет подключения к Shogun Live"),
+}
+
+# Заранее собранные датаграммы для фиксированных уведомлений об ошибках
+_ERROR_DGRAMS: Dict[str, bytes] = {
+    error_msg: _build_message(config.OSC_CAPTURE_ERROR, error_msg).dgram
+    for _, _, missing_arg_error, no_connection_error in _HANDLER_TABLE.values()
+    for error_msg in (missing_arg_error, no_connection_error)
+    if error_msg is not None
+}
+
+
+class _OSCProtocol(asyncio.DatagramProtocol):
+    """
+    Протокол asyncio, передающий полученные датаграммы обработчику OSC-пакетов
+    
+    Используется, если цикл событий не поддерживает sock_recvfrom_into (Python < 3.11).
+    """
+    
+    def __init__(self, handle_packet: Callable[[memoryview, Any], None]):
+        self._handle_packet = handle_packet
+        self._logger = logging.getLogger('ShogunOSC')
+    
+    def datagram_received(self, data: bytes, client_address: Any) -> None:
+        try:
+            self._handle_packet(memoryview(data), client_address)
+        except Exception as e:
+            self._logger.error(f"Ошибка при обработке OSC-запроса: {e}")
+    
+    def error_received(self, exc: Exception) -> None:
+        self._logger.error(f"Ошибка OSC-сокета: {exc}")
+
+
 class OSCServer(QThread):
     """Поток OSC-сервера для приема и обработки OSC-сообщений"""
-    message_signal = pyqtSignal(str, str)  # Сигнал для полученного OSC-сообщения (адрес, значение)
+    # Сигнал для полученного OSC-сообщения (адрес, значение).
+    # Подключать только в новом стиле: osc_server.message_signal.connect(slot),
+    # без разбора строковой сигнатуры через SIGNAL("message_signal(QString,QString)")
+    message_signal = pyqtSignal(str, str)
     
     def __init__(self, ip: str = "0.0.0.0", port: int = 5555, shogun_worker = None):
         super().__init__()
@@ -24,271 +334,518 @@ class OSCServer(QThread):
         self.port = port
         self.shogun_worker = shogun_worker
         self.running = True
+        # Событие завершения stop(): до него run() не возвращается, и поток считается работающим
+        self._stopped = threading.Event()
         self.dispatcher = dispatcher.Dispatcher()
-        self.server = None
-        self._socket = None
-        self.osc_client = None
+        # Приемники датаграмм: пары (цикл событий, задача приема)
+        self._receivers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Task]] = []
+        # Дополнительные циклы событий приемников и их потоки
+        self._receiver_loops: List[Tuple[asyncio.AbstractEventLoop, threading.Thread]] = []
+        # Сокет для отправки OSC-сообщений общий для всех серверов с тем же адресом назначения
+        self._broadcast_target = (
+            config.app_settings.get("osc_broadcast_ip", config.DEFAULT_OSC_BROADCAST_IP),
+            config.app_settings.get("osc_broadcast_port", config.DEFAULT_OSC_BROADCAST_PORT),
+        )
+        self._broadcast_sock = _acquire_broadcast_socket(self._broadcast_target)
+        # Сокет может создаваться повторно из потока отправки и из send_osc_message
+        self._broadcast_lock = threading.Lock()
+        # Объединять ли пачку исходящих сообщений в один OSC-пакет (bundle)
+        self._send_bundles = bool(config.app_settings.get("osc_send_bundles", False))
+        
+        # Очередь исходящих OSC-сообщений и поток, отправляющий их пачками
+        self._send_queue = queue.Queue()
+        self._send_stopped = False  # Поток отправки остановлен, новые сообщения не принимаются
+        self._sender_thread = threading.Thread(target=self._run_sender, name="osc-sender", daemon=True)
+        self._sender_thread.start()
+        
+        # Постоянный цикл событий для приема OSC-сообщений
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(target=self._run_loop, args=(self._loop,),
+                                             name="osc-loop", daemon=True)
+        self._loop_thread.start()
         
         # Настройка обработчиков OSC-сообщений
         self.setup_dispatcher()
         
     def setup_dispatcher(self) -> None:
         """Настройка обработчиков OSC-сообщений"""
-        self.dispatcher.map(config.OSC_START_RECORDING, self.start_recording)
-        self.dispatcher.map(config.OSC_STOP_RECORDING, self.stop_recording)
-        self.dispatcher.map(config.OSC_SET_CAPTURE_NAME, self.set_capture_name)
-        self.dispatcher.map(config.OSC_SET_CAPTURE_FOLDER, self.set_capture_folder)
-        self.dispatcher.map(config.OSC_SET_CAPTURE_DESCRIPTION, self.set_capture_description)
+        for address in _HANDLER_TABLE:
+            self.dispatcher.map(address, self._handle)
         self.dispatcher.set_default_handler(self.default_handler)
+        
+        # Все адреса - точные строки, поэтому для одиночных сообщений
+        # достаточно поиска по словарю вместо сопоставления шаблонов диспетчера
+        self._handlers: Dict[str, Callable] = dict.fromkeys(_HANDLER_TABLE, self._handle)
+        # Те же обработчики по адресу в виде, в котором он лежит в датаграмме
+        self._fast_handlers: Dict[bytes, Tuple[str, Callable]] = {
+            _pad_osc_string(address): (address, handler) for address, handler in self._handlers.items()
+        }
     
-    def start_recording(self, address: str, *args: Any) -> None:
+    def _handle_packet(self, data: memoryview, client_address: Any) -> None:
         """
-        Обработчик команды запуска записи
+        Разбирает OSC-пакет и вызывает обработчик по его адресу
         
         Args:
-            address: OSC-адрес сообщения
-            *args: Аргументы OSC-сообщения
+            data: Содержимое датаграммы (срез буфера приема, действителен только во время вызова)
+            client_address: Адрес отправителя
         """
-        self.logger.info(f"Получена команда OSC: {address} -> Запуск записи")
-        self.message_signal.emit(address, "Запуск записи")
+        # Быстрый путь: известный адрес без аргументов или с одной строкой
+        parsed = _parse_osc(data)
+        if parsed is not None:
+            entry = self._fast_handlers.get(parsed[0])
+            if entry is not None:
+                address, handler = entry
+                handler(address, *parsed[1])
+                return
         
-        if self.shogun_worker and self.shogun_worker.connected:
-            threading.Thread(target=self._run_async_task, 
-                             args=(self.shogun_worker.startcapture,)).start()
-        else:
-            error_msg = "Не удалось запустить запись: нет подключения к Shogun Live"
-            self.logger.warning(error_msg)
-            self.send_osc_message(config.OSC_CAPTURE_ERROR, error_msg)
+        # Полный разбор pythonosc работает с bytes, буфер приема будет переиспользован
+        data = bytes(data)
+        
+        # Пакеты (bundle) обрабатываются штатным диспетчером
+        if osc_bundle.OscBundle.dgram_is_bundle(data):
+            self.dispatcher.call_handlers_for_packet(data, client_address)
+            return
+        
+        try:
+            message = osc_message.OscMessage(data)
+        except osc_message.ParseError as e:
+            self.logger.debug(f"Некорректное OSC-сообщение от {client_address}: {e}")
+            return
+        
+        address = message.address
+        self._handlers.get(address, self.default_handler)(address, *message.params)
     
-    def stop_recording(self, address: str, *args: Any) -> None:
+    def _handle(self, address: str, *args: Any) -> None:
         """
-        Обработчик команды остановки записи
+        Обработчик команд управления Shogun Live
         
         Args:
-            address: OSC-адрес сообщения
-            *args: Аргументы OSC-сообщения
+            address: OSC-адрес сообщения (ключ _HANDLER_TABLE)
+            *args: Аргументы OSC-сообщения (для команд с аргументом первый - новое значение)
         """
-        self.logger.info(f"Получена команда OSC: {address} -> Остановка записи")
-        self.message_signal.emit(address, "Остановка записи")
+        label, worker_method, missing_arg_error, no_connection_error = _HANDLER_TABLE[address]
+        
+        call_args = ()
+        if missing_arg_error is not None:
+            if not args:
+                self.logger.warning("Получена команда OSC: %s -> %s", address, missing_arg_error)
+                self.message_signal.emit(address, f"Ошибка: {missing_arg_error}")
+                self._send_error(missing_arg_error)
+                return
+            call_args = (str(args[0]),)
+        
+        # Значение подставляется, только если оно есть в описании (описание захвата не выводится),
+        # а само описание собирается только для того, кто его увидит
+        shown_args = call_args if "%s" in label else ()
+        self.logger.info("Получена команда OSC: %s -> " + label, address, *shown_args)
+        if self.receivers(self.message_signal) > 0:
+            self.message_signal.emit(address, label % shown_args)
         
         if self.shogun_worker and self.shogun_worker.connected:
-            threading.Thread(target=self._run_async_task, 
-                             args=(self.shogun_worker.stopcapture,)).start()
+            self._run_async_task(getattr(self.shogun_worker, worker_method)(*call_args))
         else:
-            error_msg = "Не удалось остановить запись: нет подключения к Shogun Live"
-            self.logger.warning(error_msg)
-            self.send_osc_message(config.OSC_CAPTURE_ERROR, error_msg)
+            self.logger.warning(no_connection_error)
+            self._send_error(no_connection_error)
+    
+    def start_recording(self, address: str, *args: Any) -> None:
+        """Обработчик команды запуска записи (для совместимости, см. _handle)"""
+        self._handle(config.OSC_START_RECORDING, *args)
+    
+    def stop_recording(self, address: str, *args: Any) -> None:
+        """Обработчик команды остановки записи (для совместимости, см. _handle)"""
+        self._handle(config.OSC_STOP_RECORDING, *args)
     
     def set_capture_name(self, address: str, *args: Any) -> None:
+        """Обработчик команды установки имени захвата (для совместимости, см. _handle)"""
+        self._handle(config.OSC_SET_CAPTURE_NAME, *args)
+    
+    def set_capture_folder(self, address: str, *args: Any) -> None:
+        """Обработчик команды установки папки захвата (для совместимости, см. _handle)"""
+        self._handle(config.OSC_SET_CAPTURE_FOLDER, *args)
+    
+    def set_capture_description(self, address: str, *args: Any) -> None:
+        """Обработчик команды установки описания захвата (для совместимости, см. _handle)"""
+        self._handle(config.OSC_SET_CAPTURE_DESCRIPTION, *args)
+    
+    def default_handler(self, address: str, *args: Any) -> None:
         """
-        Обработчик команды установки имени захвата
+        Обработчик для неизвестных OSC-сообщений
         
         Args:
             address: OSC-адрес сообщения
-            *args: Аргументы OSC-сообщения (первый аргумент - новое имя)
+            *args: Аргументы OSC-сообщения
         """
-        if not args:
-            error_msg = "Отсутствует имя захвата"
-            self.logger.warning(f"Получена команда OSC: {address} -> {error_msg}")
-            self.message_signal.emit(address, f"Ошибка: {error_msg}")
-            self.send_osc_message(config.OSC_CAPTURE_ERROR, error_msg)
+        has_receivers = self.receivers(self.message_signal) > 0
+        # Строку аргументов собираем, только если ее кто-то увидит
+        if not has_receivers and not self.logger.isEnabledFor(logging.DEBUG):
             return
-            
-        new_name = str(args[0])
-        self.logger.info(f"Получена команда OSC: {address} -> Установка имени захвата: '{new_name}'")
-        self.message_signal.emit(address, f"Установка имени захвата: '{new_name}'")
         
-        if self.shogun_worker and self.shogun_worker.connected:
-            async def set_name_task():
-                return await self.shogun_worker.set_capture_name(new_name)
-                
-            threading.Thread(target=self._run_async_task, 
-                             args=(set_name_task,)).start()
-        else:
-            error_msg = "Не удалось установить имя захвата: нет подключения к Shogun Live"
-            self.logger.warning(error_msg)
-            self.send_osc_message(config.OSC_CAPTURE_ERROR, error_msg)
+        args_str = ", ".join(map(str, args)) if args else "нет аргументов"
+        self.logger.debug("Получено неизвестное OSC-сообщение: %s -> %s", address, args_str)
+        if has_receivers:
+            self.message_signal.emit(address, args_str)
     
-    def set_capture_folder(self, address: str, *args: Any) -> None:
+    def _run_loop(self, loop: asyncio.AbstractEventLoop) -> None:
         """
-        Обработчик команды установки папки захвата
+        Выполняет постоянный цикл событий в фоновом потоке
         
         Args:
-            address: OSC-адрес сообщения
-            *args: Аргументы OSC-сообщения (первый аргумент - новая папка)
+            loop: Цикл событий для выполнения
         """
-        if not args:
-            error_msg = "Отсутствует путь к папке захвата"
-            self.logger.warning(f"Получена команда OSC: {address} -> {error_msg}")
-            self.message_signal.emit(address, f"Ошибка: {error_msg}")
-            self.send_osc_message(config.OSC_CAPTURE_ERROR, error_msg)
-            return
-            
-        new_folder = str(args[0])
-        self.logger.info(f"Получена команда OSC: {address} -> Установка папки захвата: '{new_folder}'")
-        self.message_signal.emit(address, f"Установка папки захвата: '{new_folder}'")
-        
-        if self.shogun_worker and self.shogun_worker.connected:
-            async def set_folder_task():
-                return await self.shogun_worker.set_capture_folder(new_folder)
-                
-            threading.Thread(target=self._run_async_task, 
-                             args=(set_folder_task,)).start()
-        else:
-            error_msg = "Не удалось установить папку захвата: нет подключения к Shogun Live"
-            self.logger.warning(error_msg)
-            self.send_osc_message(config.OSC_CAPTURE_ERROR, error_msg)
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_forever()
+        finally:
+            loop.close()
     
-    def set_capture_description(self, address: str, *args: Any) -> None:
+    def _run_async_task(self, coro: Coroutine) -> Optional[concurrent.futures.Future]:
         """
-        Обработчик команды установки описания захвата
+        Планирует выполнение корутины ShogunWorker в его цикле событий
+        
+        Команды выполняются там же, где основной цикл мониторинга, поэтому
+        переподключение и остановка воркера не пересекаются с ними.
         
         Args:
-            address: OSC-адрес сообщения
-            *args: Аргументы OSC-сообщения (первый аргумент - новое описание)
-        """
-        if not args:
-            error_msg = "Отсутствует описание захвата"
-            self.logger.warning(f"Получена команда OSC: {address} -> {error_msg}")
-            self.message_signal.emit(address, f"Ошибка: {error_msg}")
-            self.send_osc_message(config.OSC_CAPTURE_ERROR, error_msg)
-            return
+            coro: Корутина для выполнения
             
-        new_description = str(args[0])
-        self.logger.info(f"Получена команда OSC: {address} -> Установка описания захвата")
-        self.message_signal.emit(address, "Установка описания захвата")
+        Returns:
+            Optional[concurrent.futures.Future]: Future с результатом или None, если воркер не запущен
+        """
+        loop = self.shogun_worker.loop if self.shogun_worker else None
+        if loop is not None and loop.is_running():
+            try:
+                future = asyncio.run_coroutine_threadsafe(coro, loop)
+            except RuntimeError:
+                # Цикл событий воркера закрылся
+                pass
+            else:
+                future.add_done_callback(self._log_task_error)
+                return future
         
-        if self.shogun_worker and self.shogun_worker.connected:
-            async def set_description_task():
-                return await self.shogun_worker.set_capture_description(new_description)
-                
-            threading.Thread(target=self._run_async_task, 
-                             args=(set_description_task,)).start()
-        else:
-            error_msg = "Не удалось установить описание захвата: нет подключения к Shogun Live"
-            self.logger.warning(error_msg)
-            self.send_osc_message(config.OSC_CAPTURE_ERROR, error_msg)
+        coro.close()
+        self.logger.warning("Команда OSC не выполнена: поток Shogun Live не запущен")
+        return None
     
-    def default_handler(self, address: str, *args: Any) -> None:
+    def _log_task_error(self, future: concurrent.futures.Future) -> None:
         """
-        Обработчик для неизвестных OSC-сообщений
+        Логирует необработанную ошибку команды, выполненной в цикле событий воркера
         
         Args:
-            address: OSC-адрес сообщения
-            *args: Аргументы OSC-сообщения
+            future: Завершенная команда
         """
-        args_str = ", ".join(str(arg) for arg in args) if args else "нет аргументов"
-        self.logger.debug(f"Получено неизвестное OSC-сообщение: {address} -> {args_str}")
-        self.message_signal.emit(address, args_str)
+        if not future.cancelled() and future.exception() is not None:
+            self.logger.error(f"Ошибка выполнения команды OSC: {future.exception()}")
     
-    def _run_async_task(self, coro_func: Callable) -> Any:
+    def send_osc_message(self, address: str, value: Any) -> bool:
         """
-        Запускает асинхронную функцию в отдельном цикле событий
+        Ставит OSC-сообщение в очередь на отправку
         
         Args:
-            coro_func: Асинхронная функция для выполнения
+            address: OSC-адрес сообщения
+            value: Значение для отправки
             
         Returns:
-            Any: Результат выполнения функции
+            bool: True если сообщение поставлено в очередь, иначе False (отправка невозможна)
         """
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(coro_func())
-        finally:
-            loop.close()
+        return self._enqueue((address, value, None))
     
-    def send_osc_message(self, address: str, value: Any) -> bool:
+    def _send_error(self, error_msg: str) -> None:
         """
-        Отправляет OSC-сообщение
+        Ставит в очередь OSC-уведомление об ошибке
+        
+        Для фиксированных сообщений используется заранее собранная датаграмма.
         
         Args:
-            address: OSC-адрес сообщения
-            value: Значение для отправки
+            error_msg: Текст ошибки
+        """
+        self._enqueue((config.OSC_CAPTURE_ERROR, error_msg, _ERROR_DGRAMS.get(error_msg)))
+    
+    def _enqueue(self, item: Tuple[str, Any, Optional[bytes]]) -> bool:
+        """
+        Ставит сообщение в очередь, если его есть чем и кому отправить
+        
+        Args:
+            item: Адрес, значение и заранее собранная датаграмма (или None)
             
         Returns:
-            bool: True если сообщение отправлено успешно, иначе False
+            bool: True если сообщение поставлено в очередь, иначе False
         """
-        try:
-            # Создаем клиент для отправки, если еще не создан
-            if not self.osc_client:
-                # Используем настройки из конфигурации
-                target_ip = config.app_settings.get("osc_broadcast_ip", config.DEFAULT_OSC_BROADCAST_IP)
-                target_port = config.app_settings.get("osc_broadcast_port", config.DEFAULT_OSC_BROADCAST_PORT)
-                
-                # Создаем клиент с обычным сокетом вместо широковещательного
-                # для избежания ошибок доступа
-                if target_ip == "255.255.255.255":
-                    # Создаем собственный сокет с поддержкой широковещательных сообщений
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-                    # Привязываем к любому доступному порту
-                    sock.bind(('', 0))
-                    # Создаем клиент с нашим сокетом
-                    self.osc_client = udp_client.SimpleUDPClient(target_ip, target_port, sock)
-                else:
-                    # Для обычного IP используем стандартный клиент
-                    self.osc_client = udp_client.SimpleUDPClient(target_ip, target_port)
-                
-                self.logger.info(f"Создан OSC-клиент для отправки сообщений на {target_ip}:{target_port}")
-                
-            # Отправляем сообщение
-            self.osc_client.send_message(address, value)
-            self.logger.debug(f"Отправлено OSC-сообщение: {address} -> {value}")
-            return True
-        except Exception as e:
-            self.logger.error(f"Ошибка отправки OSC-сообщения: {e}")
+        if self._send_stopped:
+            self.logger.warning(f"OSC-сообщение не отправлено: OSC-сервер остановлен ({item[0]})")
             return False
+        if self._ensure_broadcast_sock() is None:
+            return False
+        self._send_queue.put(item)
+        return True
+    
+    def _ensure_broadcast_sock(self) -> Optional[socket.socket]:
+        """
+        Возвращает сокет для отправки, повторно пытаясь создать его при необходимости
+        
+        Сокет мог не создаться при запуске (например, сеть еще не была доступна).
+        
+        Returns:
+            Optional[socket.socket]: Сокет или None, если создать его не удалось
+        """
+        with self._broadcast_lock:
+            if self._broadcast_sock is None and not self._send_stopped:
+                self._broadcast_sock = _acquire_broadcast_socket(self._broadcast_target)
+            return self._broadcast_sock
+    
+    def _run_sender(self) -> None:
+        """Отправляет сообщения из очереди, вычитывая ее пачками"""
+        while True:
+            # Блокируемся только в ожидании первого сообщения, остальные забираем без ожидания
+            batch = [self._send_queue.get()]
+            while len(batch) < _SEND_BATCH_SIZE:
+                try:
+                    batch.append(self._send_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            messages = []
+            stopping = False
+            for item in batch:
+                if item is None:
+                    # Сигнал остановки потока отправки
+                    stopping = True
+                    break
+                address, value, dgram = item
+                try:
+                    if dgram is None:
+                        dgram = _build_message(address, value).dgram
+                except Exception as e:
+                    self.logger.error(f"Ошибка отправки OSC-сообщения: {e}")
+                    continue
+                messages.append((dgram, address, value))
+            
+            if messages:
+                self._send_dgrams(messages)
+            if stopping:
+                return
+    
+    def _send_dgrams(self, messages: List[Tuple[bytes, str, Any]]) -> None:
+        """
+        Отправляет пачку собранных OSC-сообщений
+        
+        Если включена отправка пакетами, сообщения объединяются в OSC bundle и
+        уходят одной датаграммой через sendmsg со списком буферов (где он доступен).
+        
+        Args:
+            messages: Собранные OSC-сообщения: (датаграмма, адрес, значение)
+        """
+        sock = self._ensure_broadcast_sock()
+        if sock is None:
+            target_ip, target_port = self._broadcast_target
+            self.logger.error(f"OSC-сообщения не отправлены ({len(messages)}): "
+                              f"нет сокета для отправки на {target_ip}:{target_port}")
+            return
+        
+        log_sent = self.logger.isEnabledFor(logging.DEBUG)
+        
+        if not self._send_bundles or len(messages) == 1:
+            for dgram, address, value in messages:
+                try:
+                    _send_once_more_if_refused(sock.send, dgram)
+                except Exception as e:
+                    self.logger.error(f"Ошибка отправки OSC-сообщения: {e}")
+                    continue
+                if log_sent:
+                    self.logger.debug(f"Отправлено OSC-сообщение: {address} -> {value}")
+            return
+        
+        sent = 0
+        for buffers in _bundle_buffers([dgram for dgram, _, _ in messages]):
+            # Каждое сообщение пакета занимает два буфера: длину и датаграмму
+            bundled = messages[sent:sent + (len(buffers) - 1) // 2]
+            sent += len(bundled)
+            try:
+                if hasattr(sock, "sendmsg"):
+                    _send_once_more_if_refused(sock.sendmsg, buffers)
+                else:
+                    _send_once_more_if_refused(sock.send, b"".join(buffers))
+            except Exception as e:
+                self.logger.error(f"Ошибка отправки OSC-сообщения: {e}")
+                continue
+            if log_sent:
+                for _, address, value in bundled:
+                    self.logger.debug(f"Отправлено OSC-сообщение: {address} -> {value}")
     
     def run(self) -> None:
-        """Запуск OSC-сервера"""
+        """Запуск OSC-сервера; возвращается только после stop()"""
+        if not self.running:
+            return
         try:
             self.logger.info(f"Запуск OSC-сервера на {self.ip}:{self.port}")
             
-            # Создаем сервер с обработкой ошибок
+            # Создаем приемники с обработкой ошибок
+            receiver_count = _receiver_count()
             try:
-                self.server = osc_server.ThreadingOSCUDPServer((self.ip, self.port), self.dispatcher)
-                self._socket = self.server.socket
-            except socket.error as e:
+                for index in range(receiver_count):
+                    # Первый приемник работает в постоянном цикле событий, остальные - в собственных
+                    loop = self._loop if index == 0 else self._start_receiver_loop(index)
+                    sock = self._create_socket(reuse_port=receiver_count > 1)
+                    future = asyncio.run_coroutine_threadsafe(self._start_receiver(sock), loop)
+                    self._receivers.append((loop, future.result()))
+            except OSError as e:
                 self.logger.error(f"Не удалось создать OSC-сервер: {e}")
                 # Сигнализируем об ошибке
                 self.message_signal.emit("ERROR", f"Не удалось запустить OSC-сервер: {e}")
                 return
             
-            # Устанавливаем таймаут для сокета, чтобы можно было корректно остановить сервер
-            self._socket.settimeout(0.5)
+            if receiver_count > 1:
+                self.logger.info(f"OSC-сервер принимает сообщения в {receiver_count} потоках")
+            # Датаграммы принимаются задачами в циклах событий без опроса сокета,
+            # поток сервера лишь дожидается остановки
+            self._stopped.wait()
+        except Exception as e:
+            self.logger.error(f"Критическая ошибка OSC-сервера: {e}")
+    
+    def _start_receiver_loop(self, index: int) -> asyncio.AbstractEventLoop:
+        """
+        Запускает дополнительный цикл событий для приемника в отдельном потоке
+        
+        Args:
+            index: Номер приемника
             
-            # Запускаем сервер с возможностью остановки
-            while self.running:
+        Returns:
+            asyncio.AbstractEventLoop: Запущенный цикл событий
+        """
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=self._run_loop, args=(loop,),
+                                  name=f"osc-receiver-{index}", daemon=True)
+        thread.start()
+        self._receiver_loops.append((loop, thread))
+        return loop
+    
+    def _create_socket(self, reuse_port: bool) -> socket.socket:
+        """
+        Создает UDP-сокет OSC-сервера
+        
+        Args:
+            reuse_port: Разрешить привязку нескольких сокетов к одному порту (SO_REUSEPORT)
+            
+        Returns:
+            socket.socket: Привязанный сокет
+        """
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            sock.setblocking(False)
+            if reuse_port:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            sock.bind((self.ip, self.port))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+    
+    async def _start_receiver(self, sock: socket.socket) -> asyncio.Task:
+        """
+        Запускает задачу приема датаграмм в текущем цикле событий
+        
+        Args:
+            sock: Привязанный сокет приемника
+            
+        Returns:
+            asyncio.Task: Задача приема
+        """
+        loop = asyncio.get_running_loop()
+        if hasattr(loop, "sock_recvfrom_into"):
+            return loop.create_task(self._receive(sock))
+        
+        # До Python 3.11 прием в готовый буфер недоступен, используем datagram endpoint
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _OSCProtocol(self._handle_packet), sock=sock)
+        return loop.create_task(self._receive_endpoint(transport))
+    
+    async def _receive(self, sock: socket.socket) -> None:
+        """
+        Принимает датаграммы в заранее выделенный буфер и обрабатывает их
+        
+        Args:
+            sock: Привязанный неблокирующий сокет приемника
+        """
+        loop = asyncio.get_running_loop()
+        buffer = bytearray(_RECV_BUFFER_SIZE)
+        view = memoryview(buffer)
+        try:
+            while True:
                 try:
-                    self.server.handle_request()
-                except socket.timeout:
-                    # Таймаут сокета - нормальная ситуация, продолжаем работу
+                    nbytes, client_address = await loop.sock_recvfrom_into(sock, buffer)
+                except ConnectionResetError:
+                    # Windows так сообщает о недоставленной ранее датаграмме, сокет остается рабочим
                     continue
+                try:
+                    self._handle_packet(view[:nbytes], client_address)
                 except Exception as e:
-                    if self.running:  # Логируем ошибку только если сервер должен работать
-                        self.logger.error(f"Ошибка при обработке OSC-запроса: {e}")
-        except Exception as e:
-            self.logger.error(f"Критическая ошибка OSC-сервера: {e}")
+                    self.logger.error(f"Ошибка при обработке OSC-запроса: {e}")
+        except OSError as e:
+            self.logger.error(f"Ошибка OSC-сокета: {e}")
+        finally:
+            sock.close()
+    
+    async def _receive_endpoint(self, transport: asyncio.DatagramTransport) -> None:
+        """
+        Удерживает открытым транспорт приемника до отмены задачи
+        
+        Args:
+            transport: Транспорт datagram endpoint приемника
+        """
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            transport.close()
+    
+    async def _stop_receiver(self, task: asyncio.Task) -> None:
+        """
+        Отменяет задачу приема и дожидается закрытия ее сокета
+        
+        Args:
+            task: Задача приема
+        """
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
     
     def stop(self) -> None:
         """Остановка OSC-сервера"""
         self.running = False
-        # Закрываем сервер если он создан
-        if self.server:
+        # Останавливаем приемники в их циклах событий
+        for loop, task in self._receivers:
             try:
-                self.server.server_close()
+                asyncio.run_coroutine_threadsafe(self._stop_receiver(task), loop).result(timeout=1.0)
             except Exception as e:
                 self.logger.error(f"Ошибка при закрытии OSC-сервера: {e}")
+        self._receivers.clear()
         
-        # Закрываем клиент для отправки сообщений
-        if self.osc_client and hasattr(self.osc_client, '_sock'):
-            try:
-                self.osc_client._sock.close()
-            except Exception as e:
-                self.logger.error(f"Ошибка при закрытии OSC-клиента: {e}")
+        # Останавливаем дополнительные циклы событий приемников
+        for loop, thread in self._receiver_loops:
+            if thread.is_alive():
+                loop.call_soon_threadsafe(loop.stop)
+                thread.join()
+        self._receiver_loops.clear()
+        
+        # Дожидаемся отправки сообщений, уже стоящих в очереди
+        self._send_stopped = True
+        if self._sender_thread.is_alive():
+            self._send_queue.put(None)
+            self._sender_thread.join()
+        
+        # Освобождаем общий сокет для отправки сообщений
+        with self._broadcast_lock:
+            if self._broadcast_sock:
+                try:
+                    _release_broadcast_socket(self._broadcast_target)
+                except Exception as e:
+                    self.logger.error(f"Ошибка при закрытии OSC-клиента: {e}")
+                self._broadcast_sock = None
+        
+        # Останавливаем цикл событий и дожидаемся завершения его потока
+        if self._loop_thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
                 
         self.logger.info("OSC-сервер остановлен")
+        self._stopped.set()
 
 def format_osc_message(address: str, value: Any, with_timestamp: bool = True) -> str:
     """
@@ -302,8 +859,15 @@ def format_osc_message(address: str, value: Any, with_timestamp: bool = True) ->
     Returns:
         str: Отформатированное сообщение
     """
+    global _LAST_TS_SECOND, _LAST_TS_PREFIX
+    
     if with_timestamp:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        return f"<b>[{timestamp}]</b> {address} → {value}"
+        # Метка времени меняется раз в секунду, поэтому форматируем ее не чаще
+        now = time.time()
+        sec = int(now)
+        if sec != _LAST_TS_SECOND:
+            _LAST_TS_PREFIX = f"<b>[{time.strftime('%H:%M:%S', time.localtime(now))}]</b> "
+            _LAST_TS_SECOND = sec
+        return f"{_LAST_TS_PREFIX}{address} → {value}"
     else:
         return f"{address} → {value}"
\ No newline at end of file
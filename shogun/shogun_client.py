@@ -4,16 +4,43 @@
 """
 
 import asyncio
+import concurrent.futures
 import logging
+import os
+import random
+import sys
 import time
 import psutil
-from typing import Optional, Tuple, Union, Any, Dict
+from typing import Optional, Tuple, Union, Any, Dict, Callable
 from PyQt5.QtCore import QThread, pyqtSignal
 
 from vicon_core_api import Client, Result
 from shogun_live_api import CaptureServices
 import config
 
+# Необязательная зависимость: uvloop дает более быстрый цикл событий (в Windows недоступен)
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+# В Windows завершение процесса отслеживается по его дескриптору
+if sys.platform == 'win32':
+    import ctypes
+    from ctypes import wintypes
+    
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.OpenProcess.restype = wintypes.HANDLE
+    _kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    _kernel32.WaitForSingleObject.restype = wintypes.DWORD
+    _kernel32.WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+    _kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+else:
+    _kernel32 = None
+
+_SYNCHRONIZE = 0x00100000  # Право доступа к процессу для ожидания его завершения
+_WAIT_TIMEOUT = 0x00000102  # Результат WaitForSingleObject: процесс еще работает
+
 class ShogunWorker(QThread):
     """Рабочий поток для взаимодействия с Shogun Live"""
     connection_signal = pyqtSignal(bool)  # Сигнал состояния подключения
@@ -30,109 +57,321 @@ class ShogunWorker(QThread):
         self.connected = False
         self.shogun_client = None
         self.capture = None
+        self._set_description: Optional[Callable] = None  # capture.set_capture_description, если есть в API
+        self._client_close: Optional[Callable] = None  # Метод закрытия соединения клиента, если есть
         self.shogun_pid = None
+        self._shogun_proc: Optional[psutil.Process] = None  # Кэшированный процесс Shogun Live
+        self._watched_pid: Optional[int] = None  # PID процесса, завершение которого отслеживается
+        self._shogun_exit_fd: Optional[int] = None  # pidfd процесса Shogun Live (Linux)
+        self._shogun_handle: Optional[int] = None  # Дескриптор процесса Shogun Live (Windows)
         self.loop = None
-        self._last_check_time = 0  # Для оптимизации частоты проверок
+        self._stop_event: Optional[asyncio.Event] = None  # Событие остановки в цикле событий воркера
         self._check_interval = 1.0  # Интервал проверки в секундах
         self._current_capture_name = ""  # Текущее имя захвата для отслеживания изменений
         self._current_capture_folder = ""  # Текущая директория захвата
         self._current_capture_description = ""  # Текущее описание захвата
+        self._settings_callbacks = False  # Shogun Live уведомляет об изменении настроек захвата
+        # Счетчик уведомлений об изменении настроек (увеличивается только в потоке API) и его
+        # значение при последнем запросе настроек; разные значения - настройки нужно запросить
+        self._settings_version = 0
+        self._settings_polled = 0
+        self._settings_callback_ids: list = []  # Идентификаторы подписок на изменение настроек
+        self._last_error_sig: Tuple[str, float] = ("", 0.0)  # Последняя ошибка записи и время ее отправки
+        self._last_connected: Optional[bool] = None  # Последнее отправленное в GUI состояние соединения
+        self._status_connected = config.STATUS_CONNECTED
+        self._status_disconnected = config.STATUS_DISCONNECTED
+        # Пул потоков для синхронных запросов к API Shogun Live
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='shogun-rpc')
+        self._reconnect_task: Optional[asyncio.Task] = None  # Текущая попытка переподключения
         
     def run(self):
         """Основной метод потока"""
-        self.loop = asyncio.new_event_loop()
+        self.loop = uvloop.new_event_loop() if uvloop else asyncio.new_event_loop()
         asyncio.set_event_loop(self.loop)
+        self._stop_event = asyncio.Event()
         
+        # Весь мониторинг выполняется одной долгоживущей корутиной
+        try:
+            self.loop.run_until_complete(self._main_async())
+        finally:
+            self.loop.close()
+    
+    async def _main_async(self) -> None:
+        """Основной цикл мониторинга Shogun Live"""
         # Первая попытка подключения
-        self.connected = self.loop.run_until_complete(self.connect_shogun())
+        self.connected = await self.connect_shogun()
         self.connection_signal.emit(self.connected)
         
         # Основной цикл мониторинга
         while self.running:
             try:
-                current_time = time.time()
-                # Оптимизация: проверяем только через определенные интервалы
-                if current_time - self._last_check_time >= self._check_interval:
-                    self._last_check_time = current_time
-                    
+                # Без подключенных к сигналам наблюдателей опрос состояния записи и статус
+                # не нужны, но процесс и подключение проверяем: по self.connected
+                # OSCServer решает, выполнять ли команды
+                observed = self.receivers(self.status_signal) > 0 or self.receivers(self.recording_signal) > 0
+                
+                ticked = self.connected and observed
+                if ticked:
+                    # Опрашиваем существующее соединение вместе с проверкой процесса
+                    shogun_running = await self._tick()
+                else:
                     # Проверяем наличие процесса Shogun Live
                     shogun_running = self.check_shogun_process()
+                
+                # Проверяем соединение, если процесс запущен
+                if shogun_running:
+                    # Подписываемся на завершение найденного процесса (только в потоке цикла событий)
+                    if self.shogun_pid != self._watched_pid:
+                        self._watch_shogun_process(self.shogun_pid)
                     
-                    # Проверяем соединение, если процесс запущен
-                    if shogun_running:
-                        if not self.connected:
-                            self.logger.info("Shogun Live обнаружен. Выполняем подключение...")
-                            self.connected = self.loop.run_until_complete(self.connect_shogun())
-                            self.connection_signal.emit(self.connected)
-                        else:
-                            # Проверяем существующее соединение
-                            connection_ok = self.loop.run_until_complete(self.ensure_connection())
-                            if not connection_ok:
-                                self.logger.warning("Соединение с Shogun Live потеряно")
-                                self.connected = False
-                                self.connection_signal.emit(False)
-                            
-                            # Если подключены, обновляем статус записи
-                            if self.connected:
-                                is_recording = self.loop.run_until_complete(self.check_shogun())
-                                self.recording_signal.emit(is_recording)
-                                
-                                # Проверяем изменение имени захвата и папки захвата
-                                self.loop.run_until_complete(self._check_capture_settings_change())
-                    else:
-                        if self.connected:
-                            self.logger.warning("Shogun Live не обнаружен. Соединение потеряно.")
-                            self.connected = False
-                            self.connection_signal.emit(False)
-                            self.recording_signal.emit(False)
-                    
-                    # Обновляем статус в интерфейсе
-                    status = config.STATUS_CONNECTED if self.connected else config.STATUS_DISCONNECTED
-                    self.status_signal.emit(status)
+                    # После неудачного переподключения в _tick новую попытку делаем
+                    # только на следующей проверке, а после остановки - не делаем совсем
+                    if not self.connected and not ticked and self.running:
+                        self.logger.info("Shogun Live обнаружен. Выполняем подключение...")
+                        self.connected = await self.connect_shogun()
+                        self.connection_signal.emit(self.connected)
+                else:
+                    if self.connected:
+                        self.logger.warning("Shogun Live не обнаружен. Соединение потеряно.")
+                        self.connected = False
+                        self.connection_signal.emit(False)
+                        self.recording_signal.emit(False)
+                
+                # Обновляем статус в интерфейсе только при его изменении
+                connected = self.connected
+                if not observed:
+                    self._last_connected = None  # Статус отправим первому наблюдателю
+                elif connected != self._last_connected:
+                    self._last_connected = connected
+                    self.status_signal.emit(self._status_connected if connected else self._status_disconnected)
                 
-                # Короткая пауза для снижения нагрузки на CPU
-                time.sleep(0.1)
+                # Ждем следующей проверки; остановка воркера прерывает ожидание
+                await self._wait_stop(self._check_interval)
             except Exception as e:
                 self.logger.error(f"Ошибка в основном цикле мониторинга: {e}")
                 # Продолжаем работу после ошибки
-                time.sleep(1)
+                await self._wait_stop(1)
+        
+        await self._shutdown()
+    
+    def _request_stop(self) -> None:
+        """Запрашивает остановку воркера; выполняется в цикле событий воркера"""
+        self.running = False
+        if self._stop_event is not None:
+            self._stop_event.set()
+    
+    async def _shutdown(self) -> None:
+        """
+        Завершает работу воркера в его цикле событий
+        
+        Сначала дожидается остальных задач цикла, включая команды OSC, затем
+        закрывает соединение, поэтому клиент не закрывается, пока им еще пользуются.
+        """
+        # Команда OSC может успеть запланироваться, пока ждем предыдущие задачи
+        while True:
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            if not pending:
+                break
+            await asyncio.gather(*pending, return_exceptions=True)
+        
+        self._unwatch_shogun_process()
+        
+        # Закрываем соединение при остановке
+        if self._client_close:
+            try:
+                self._client_close()
+            except Exception as e:
+                self.logger.debug(f"Ошибка при закрытии соединения: {e}")
+        self._executor.shutdown(wait=False)
+    
+    async def _tick(self) -> bool:
+        """
+        Опрашивает Shogun Live одной пачкой запросов: состояние записи, имя и папку захвата
+        
+        Имя и папка запрашиваются только по уведомлению Shogun Live об их изменении
+        (или каждый раз, если API не поддерживает уведомления).
+        Поиск процесса выполняется в пуле потоков одновременно с запросами,
+        если его завершение не отслеживается средствами ОС; состояние воркера
+        по результату поиска обновляется уже в потоке цикла событий.
+        Ошибка любого из запросов считается потерей соединения.
+        
+        Returns:
+            bool: True если процесс Shogun Live запущен, иначе False
+        """
+        # Значение счетчика запоминаем до запросов: уведомление, пришедшее во время
+        # запросов, снова изменит счетчик, и настройки будут запрошены на следующей проверке
+        version = self._settings_version
+        poll_settings = version != self._settings_polled or not self._settings_callbacks
+        self._settings_polled = version
+        
+        calls = [self._call(self.capture.latest_capture_state)]
+        if poll_settings:
+            calls.append(self._call(self.capture.capture_name))
+            calls.append(self._call(self.capture.capture_folder))
+        watched = self._watched_process_alive()
+        if not watched:
+            calls.append(self._call(self._lookup_shogun_process, self._shogun_proc))
+        replies = await asyncio.gather(*calls, return_exceptions=True)
+        
+        if watched:
+            # Отслеживание снимается, если процесс завершился во время запросов
+            shogun_running = bool(self._watched_process_alive())
+        else:
+            proc = replies.pop()
+            if isinstance(proc, Exception):
+                self.logger.debug(f"Ошибка проверки процесса Shogun: {proc}")
+                proc = None
+            shogun_running = self._apply_shogun_process(proc)
+        
+        # Процесс завершился или перезапущен - ответы API уже не актуальны
+        if not shogun_running or not self.connected:
+            return shogun_running
+        
+        for reply in replies:
+            if isinstance(reply, Exception):
+                self.logger.debug(f"Ошибка проверки соединения: {reply}")
+                if not await self.reconnect_shogun():
+                    self.logger.warning("Соединение с Shogun Live потеряно")
+                    self.connected = False
+                    self.connection_signal.emit(False)
+                return True
+        
+        self.recording_signal.emit(self._is_recording_state(replies[0]))
+        if poll_settings:
+            self._apply_capture_settings(replies[1], replies[2])
+        return True
     
-    async def _check_capture_settings_change(self) -> None:
-        """Проверяет изменение настроек захвата в Shogun Live"""
+    async def _subscribe_capture_settings(self) -> bool:
+        """
+        Подписывается на уведомления Shogun Live об изменении имени и папки захвата
+        
+        Прежние подписки этого же объекта CaptureServices предварительно снимаются.
+        Если снять их нельзя, повторно не подписываемся и переходим на опрос,
+        чтобы обработчики не накапливались при каждом переподключении.
+        
+        Returns:
+            bool: True если подписка выполнена, иначе False (используется опрос)
+        """
+        if self._settings_callback_ids and not await self._unsubscribe_capture_settings():
+            self.logger.debug("Не удалось снять прежние подписки на изменения настроек захвата, используется опрос")
+            return False
+        
+        add_name_callback = getattr(self.capture, 'add_capture_name_changed_callback', None)
+        add_folder_callback = getattr(self.capture, 'add_capture_folder_changed_callback', None)
+        if add_name_callback is None or add_folder_callback is None:
+            self.logger.debug("API Shogun Live не поддерживает уведомления об изменении настроек захвата")
+            return False
+        
         try:
-            if not self.capture:
-                return
-                
-            # Получаем текущее имя захвата
-            result, capture_name = self.capture.capture_name()
-            
-            # Проверяем успешность запроса
-            if not result:
-                self.logger.debug(f"Не удалось получить имя захвата: {result}")
-                return
-                
-            # Если имя изменилось, отправляем сигнал
-            if capture_name != self._current_capture_name:
-                self.logger.info(f"Имя захвата изменилось: '{self._current_capture_name}' -> '{capture_name}'")
-                self._current_capture_name = capture_name
-                self.capture_name_changed_signal.emit(capture_name)
+            self._settings_callback_ids.append(
+                await self._call(add_name_callback, self._on_capture_settings_changed))
+            self._settings_callback_ids.append(
+                await self._call(add_folder_callback, self._on_capture_settings_changed))
+            return True
+        except Exception as e:
+            self.logger.debug(f"Не удалось подписаться на изменения настроек захвата: {e}")
+            return False
+    
+    async def _unsubscribe_capture_settings(self) -> bool:
+        """
+        Снимает подписки на уведомления об изменении имени и папки захвата
+        
+        Returns:
+            bool: True если все подписки сняты, иначе False
+        """
+        remove_callback = getattr(self.capture, 'remove_callback', None)
+        if remove_callback is None:
+            return False
+        
+        try:
+            for callback_id in self._settings_callback_ids:
+                await self._call(remove_callback, callback_id)
+        except Exception as e:
+            self.logger.debug(f"Ошибка при снятии подписки на изменения настроек захвата: {e}")
+            return False
+        self._settings_callback_ids = []
+        return True
+    
+    def _on_capture_settings_changed(self, *args: Any) -> None:
+        """
+        Уведомление Shogun Live об изменении имени или папки захвата
+        
+        Вызывается в потоке API Shogun Live, поэтому только помечает настройки
+        для запроса на следующей проверке; сигналы отправляет основной цикл.
+        Счетчик изменяется только здесь, поэтому уведомления не теряются.
+        """
+        self._settings_version += 1
+    
+    async def _call(self, fn: Callable, *args: Any) -> Any:
+        """
+        Выполняет синхронный запрос к API Shogun Live в пуле потоков
+        
+        Запросы не блокируют цикл событий, поэтому запросы из одной пачки
+        выполняются по сети одновременно.
+        
+        Args:
+            fn: Метод API
+            *args: Аргументы метода
             
-            # Получаем текущую папку захвата
-            result, capture_folder = self.capture.capture_folder()
+        Returns:
+            Any: Результат метода
+        """
+        return await self.loop.run_in_executor(self._executor, fn, *args)
+    
+    def _apply_capture_settings(self, name_reply: Tuple[Result, str], folder_reply: Tuple[Result, str]) -> None:
+        """
+        Обрабатывает полученные имя и папку захвата и сообщает об их изменении
+        
+        Args:
+            name_reply: Ответ capture_name() - (результат, имя захвата)
+            folder_reply: Ответ capture_folder() - (результат, папка захвата)
+        """
+        result, capture_name = name_reply
+        # Проверяем успешность запроса
+        if not result:
+            self.logger.debug(f"Не удалось получить имя захвата: {result}")
+        # Если имя изменилось, отправляем сигнал
+        elif capture_name != self._current_capture_name:
+            self.logger.info(f"Имя захвата изменилось: '{self._current_capture_name}' -> '{capture_name}'")
+            self._current_capture_name = capture_name
+            self.capture_name_changed_signal.emit(capture_name)
+        
+        result, capture_folder = folder_reply
+        # Проверяем успешность запроса
+        if not result:
+            self.logger.debug(f"Не удалось получить папку захвата: {result}")
+        # Если папка изменилась, отправляем сигнал
+        elif capture_folder != self._current_capture_folder:
+            self.logger.info(f"Папка захвата изменилась: '{self._current_capture_folder}' -> '{capture_folder}'")
+            self._current_capture_folder = capture_folder
+            self.capture_folder_changed_signal.emit(capture_folder)
+    
+    @staticmethod
+    def _is_recording_state(state: Any) -> bool:
+        """
+        Определяет по ответу latest_capture_state(), идет ли запись
+        
+        Ответ имеет вид (результат, состояние, ...), где состояние - перечисление
+        (например, EStarted). Проверяется только имя значения перечисления, без
+        построения строкового представления всего ответа.
+        
+        Args:
+            state: Ответ latest_capture_state()
             
-            # Проверяем успешность запроса
-            if not result:
-                self.logger.debug(f"Не удалось получить папку захвата: {result}")
-                return
-                
-            # Если папка изменилась, отправляем сигнал
-            if capture_folder != self._current_capture_folder:
-                self.logger.info(f"Папка захвата изменилась: '{self._current_capture_folder}' -> '{capture_folder}'")
-                self._current_capture_folder = capture_folder
-                self.capture_folder_changed_signal.emit(capture_folder)
-                
-        except Exception as e:
-            self.logger.debug(f"Ошибка при проверке настроек захвата: {e}")
+        Returns:
+            bool: True если запись активна, иначе False
+        """
+        try:
+            result, capture_state = state[0], state[1]
+        except (TypeError, IndexError):
+            # Неожиданный формат ответа - проверяем его строковое представление
+            return 'Started' in str(state)
+        if not result:
+            return False
+        state_name = getattr(capture_state, 'name', None)
+        if state_name is None:
+            state_name = str(capture_state)
+        return 'Started' in state_name
     
     def check_shogun_process(self) -> bool:
         """
@@ -142,23 +381,191 @@ class ShogunWorker(QThread):
             bool: True если процесс Shogun Live запущен, иначе False
         """
         try:
-            for proc in psutil.process_iter(['pid', 'name']):
-                proc_name = proc.info['name']
-                if proc_name and ('ShogunLive' in proc_name or 'Shogun Live' in proc_name):
-                    pid = proc.info['pid']
-                    # Если PID изменился, считаем что Shogun перезапущен
-                    if self.shogun_pid and self.shogun_pid != pid:
-                        self.logger.info(f"Обнаружен перезапуск Shogun Live (PID: {self.shogun_pid} -> {pid})")
-                        self.shogun_pid = pid
-                        self.connected = False  # Сбрасываем подключение
-                        return True
-                    self.shogun_pid = pid
-                    return True
-            return False
+            if self._watched_process_alive():
+                return True
+            return self._apply_shogun_process(self._lookup_shogun_process(self._shogun_proc))
         except Exception as e:
             self.logger.debug(f"Ошибка проверки процесса Shogun: {e}")
             return False
     
+    def _watched_process_alive(self) -> Optional[bool]:
+        """
+        Проверяет процесс Shogun Live, завершение которого отслеживается средствами ОС
+        
+        Выполняется в потоке цикла событий: при завершении процесса снимает отслеживание.
+        
+        Returns:
+            Optional[bool]: True если процесс работает, None если он не отслеживается
+            или уже завершился (нужен поиск процесса)
+        """
+        # Завершение процесса отслеживается ядром (pidfd), опрос не нужен
+        if self._shogun_exit_fd is not None:
+            return True
+        
+        # Дескриптор процесса проверяется без ожидания
+        if self._shogun_handle is not None:
+            if _kernel32.WaitForSingleObject(self._shogun_handle, 0) == _WAIT_TIMEOUT:
+                return True
+            self._unwatch_shogun_process()
+            self._shogun_proc = None
+        return None
+    
+    def _lookup_shogun_process(self, cached: Optional[psutil.Process]) -> Optional[psutil.Process]:
+        """
+        Находит процесс Shogun Live, не изменяя состояние воркера
+        
+        Может выполняться в пуле потоков одновременно с запросами к API.
+        
+        Args:
+            cached: Ранее найденный процесс или None
+            
+        Returns:
+            Optional[psutil.Process]: Процесс Shogun Live или None, если он не найден
+        """
+        # Быстрый путь: процесс уже найден, проверяем только его
+        if cached is not None:
+            try:
+                if cached.is_running():
+                    return cached
+            except psutil.Error:
+                pass
+        
+        # Медленный путь: ищем процесс среди всех процессов системы
+        return self._find_shogun_process()
+    
+    def _apply_shogun_process(self, proc: Optional[psutil.Process]) -> bool:
+        """
+        Запоминает найденный процесс Shogun Live; выполняется в потоке цикла событий
+        
+        Args:
+            proc: Результат _lookup_shogun_process
+            
+        Returns:
+            bool: True если процесс Shogun Live запущен, иначе False
+        """
+        self._shogun_proc = proc
+        if proc is None:
+            return False
+        
+        pid = proc.pid
+        # Если PID изменился, считаем что Shogun перезапущен
+        if self.shogun_pid and self.shogun_pid != pid:
+            self.logger.info(f"Обнаружен перезапуск Shogun Live (PID: {self.shogun_pid} -> {pid})")
+            self.shogun_pid = pid
+            self.connected = False  # Сбрасываем подключение
+            return True
+        self.shogun_pid = pid
+        return True
+    
+    def _watch_shogun_process(self, pid: int) -> None:
+        """
+        Подписывается на завершение процесса Shogun Live средствами ОС
+        
+        В Linux используется pidfd в цикле событий воркера, в Windows - дескриптор
+        процесса, который проверяется без ожидания на каждой проверке.
+        Если ни то, ни другое недоступно, остается проверка через psutil.
+        
+        Args:
+            pid: PID процесса Shogun Live
+        """
+        self._unwatch_shogun_process()
+        self._watched_pid = pid
+        
+        if hasattr(os, 'pidfd_open'):
+            try:
+                fd = os.pidfd_open(pid)
+            except OSError as e:
+                self.logger.debug(f"Не удалось открыть pidfd процесса Shogun Live: {e}")
+                return
+            try:
+                self.loop.add_reader(fd, self._on_shogun_exit)
+            except (NotImplementedError, OSError) as e:
+                os.close(fd)
+                self.logger.debug(f"Не удалось отслеживать pidfd процесса Shogun Live: {e}")
+                return
+            self._shogun_exit_fd = fd
+        elif _kernel32 is not None:
+            handle = _kernel32.OpenProcess(_SYNCHRONIZE, False, pid)
+            if handle:
+                self._shogun_handle = handle
+            else:
+                self.logger.debug(f"Не удалось открыть процесс Shogun Live: ошибка {ctypes.get_last_error()}")
+    
+    def _unwatch_shogun_process(self) -> None:
+        """Прекращает отслеживание завершения процесса Shogun Live"""
+        if self._shogun_exit_fd is not None:
+            try:
+                self.loop.remove_reader(self._shogun_exit_fd)
+            except Exception as e:
+                self.logger.debug(f"Ошибка при отписке от pidfd: {e}")
+            os.close(self._shogun_exit_fd)
+            self._shogun_exit_fd = None
+        if self._shogun_handle is not None:
+            _kernel32.CloseHandle(self._shogun_handle)
+            self._shogun_handle = None
+        self._watched_pid = None
+    
+    def _on_shogun_exit(self) -> None:
+        """Обработчик завершения процесса Shogun Live (pidfd стал доступен для чтения)"""
+        self.logger.info(f"Процесс Shogun Live завершился (PID: {self._watched_pid})")
+        self._unwatch_shogun_process()
+        self._shogun_proc = None
+        if self.connected:
+            self.logger.warning("Shogun Live не обнаружен. Соединение потеряно.")
+            self.connected = False
+            self.connection_signal.emit(False)
+            self.recording_signal.emit(False)
+    
+    def _find_shogun_process(self) -> Optional[psutil.Process]:
+        """
+        Ищет процесс Shogun Live среди всех процессов системы
+        
+        Returns:
+            Optional[psutil.Process]: Процесс Shogun Live или None, если он не найден
+        """
+        if sys.platform.startswith('linux'):
+            return self._find_shogun_process_proc()
+        
+        for proc in psutil.process_iter():
+            try:
+                # Читаем только имя; данные процесса считываются из системы один раз
+                with proc.oneshot():
+                    proc_name = proc.name()
+            except psutil.Error:
+                # Процесс завершился или недоступен во время перебора
+                continue
+            if proc_name and ('ShogunLive' in proc_name or 'Shogun Live' in proc_name):
+                return proc
+        return None
+    
+    def _find_shogun_process_proc(self) -> Optional[psutil.Process]:
+        """
+        Ищет процесс Shogun Live в /proc (Linux)
+        
+        Читает только /proc/<pid>/comm, без разбора остальных данных процесса,
+        которые загружает psutil.process_iter().
+        
+        Returns:
+            Optional[psutil.Process]: Процесс Shogun Live или None, если он не найден
+        """
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    # Имя читаем байтами: имена процессов не обязаны быть в UTF-8
+                    with open(f'/proc/{entry.name}/comm', 'rb') as f:
+                        proc_name = f.read()
+                except OSError:
+                    # Процесс завершился во время перебора
+                    continue
+                if b'ShogunLive' in proc_name or b'Shogun Live' in proc_name:
+                    try:
+                        return psutil.Process(int(entry.name))
+                    except psutil.Error:
+                        continue
+        return None
+    
     async def connect_shogun(self) -> bool:
         """
         Подключение к Shogun Live
@@ -168,31 +575,48 @@ class ShogunWorker(QThread):
         """
         try:
             self.logger.info("Подключение к Shogun Live...")
-            # Добавляем таймаут для операции подключения
-            self.shogun_client = Client('localhost')
-            self.capture = CaptureServices(self.shogun_client)
+            # Существующий клиент переподключаем, если API это позволяет
+            if not await self._reconnect_client():
+                self.shogun_client = await self._call(Client, 'localhost')
+                self.capture = CaptureServices(self.shogun_client)
+                # Подписки остались у прежнего клиента
+                self._settings_callback_ids = []
+            
+            # Необязательные методы API определяем один раз при подключении
+            self._set_description = getattr(self.capture, 'set_capture_description', None)
+            self._client_close = (getattr(self.shogun_client, 'disconnect', None)
+                                  or getattr(self.shogun_client, 'close', None))
             
             # Проверяем, что соединение действительно работает
-            if not await self._test_connection():
+            try:
+                await self._call(self.capture.latest_capture_state)
+            except Exception as e:
+                self.logger.debug(f"Тест соединения не пройден: {e}")
                 self.logger.warning("Соединение установлено, но API не отвечает")
                 return False
             
             # Получаем текущие настройки захвата при подключении
             try:
                 # Имя захвата
-                result, capture_name = self.capture.capture_name()
-                if result:
+                result, capture_name = await self._call(self.capture.capture_name)
+                if result and capture_name != self._current_capture_name:
                     self._current_capture_name = capture_name
                     self.logger.info(f"Текущее имя захвата: '{capture_name}'")
                     
-                # Папка захвата
-                result, capture_folder = self.capture.capture_folder()
-                if result:
+                # Папка захвата; без изменений GUI не обновляем
+                result, capture_folder = await self._call(self.capture.capture_folder)
+                if result and capture_folder != self._current_capture_folder:
                     self._current_capture_folder = capture_folder
                     self.logger.info(f"Текущая папка захвата: '{capture_folder}'")
                     self.capture_folder_changed_signal.emit(capture_folder)
             except Exception as e:
                 self.logger.debug(f"Не удалось получить настройки захвата при подключении: {e}")
+            
+            # Изменения имени и папки захвата отслеживаем по уведомлениям, если это возможно.
+            # Подписываемся и для переподключенного клиента: после перезапуска Shogun Live
+            # прежние подписки теряются (сами они при этом снимаются перед новой подпиской)
+            self._settings_polled = self._settings_version
+            self._settings_callbacks = await self._subscribe_capture_settings()
                 
             self.logger.info("Подключено к Shogun Live")
             return True
@@ -200,56 +624,80 @@ class ShogunWorker(QThread):
             self.logger.error(f"Ошибка подключения к Shogun Live: {e}")
             return False
     
-    async def _test_connection(self) -> bool:
+    async def _reconnect_client(self) -> bool:
         """
-        Проверяет, что соединение с Shogun Live работает
+        Переподключает существующий клиент Shogun Live без создания нового
         
         Returns:
-            bool: True если соединение работает, иначе False
+            bool: True если клиент переподключен, иначе False (нужен новый клиент)
         """
+        reconnect = getattr(self.shogun_client, 'reconnect', None)
+        if reconnect is None or self.capture is None:
+            return False
+        
         try:
-            # Выполняем простой запрос для проверки соединения
-            _ = str(self.capture.latest_capture_state())
+            await self._call(reconnect)
             return True
         except Exception as e:
-            self.logger.debug(f"Тест соединения не пройден: {e}")
+            self.logger.debug(f"Не удалось переподключить существующий клиент: {e}")
             return False
     
-    async def ensure_connection(self) -> bool:
+    async def ensure_connection(self) -> Optional[Any]:
         """
         Проверка соединения и переподключение при необходимости
         
         Returns:
-            bool: True если соединение активно, иначе False
+            Optional[Any]: Ответ latest_capture_state() если соединение активно, иначе None
         """
         if not self.shogun_client or not self.capture:
-            return await self.connect_shogun()
+            if not await self.connect_shogun():
+                return None
+        else:
+            try:
+                # Простая проверка - запрос состояния записи, его ответ возвращаем вызывающему
+                return await self._call(self.capture.latest_capture_state)
+            except Exception as e:
+                self.logger.debug(f"Ошибка проверки соединения: {e}")
+                if not await self.reconnect_shogun():
+                    return None
         
+        # После подключения запрашиваем состояние записи заново
         try:
-            # Простая проверка - пытаемся выполнить запрос к API
-            status = str(self.capture.latest_capture_state())
-            return True
+            return await self._call(self.capture.latest_capture_state)
         except Exception as e:
             self.logger.debug(f"Ошибка проверки соединения: {e}")
-            return await self.reconnect_shogun()
+            return None
     
     async def reconnect_shogun(self) -> bool:
+        """
+        Переподключение к Shogun Live
+        
+        Одновременные запросы (основной цикл и команды OSC) дожидаются одной
+        и той же попытки, поэтому клиент не заменяется, пока им пользуется другая задача.
+        
+        Returns:
+            bool: True если переподключение успешно, иначе False
+        """
+        if self._reconnect_task is None or self._reconnect_task.done():
+            self._reconnect_task = self.loop.create_task(self._reconnect())
+        return await asyncio.shield(self._reconnect_task)
+    
+    async def _reconnect(self) -> bool:
         """
         Переподключение к Shogun Live с экспоненциальной отсрочкой
         
+        Задержка случайно растягивается или сокращается, чтобы несколько экземпляров
+        не переподключались синхронно. Попытки ограничены общим временем.
+        
         Returns:
             bool: True если переподключение успешно, иначе False
         """
         self.logger.info("Попытка переподключения к Shogun Live...")
         
         # Закрываем существующее соединение если оно есть
-        if self.shogun_client:
+        if self._client_close:
             try:
-                # Закрытие клиентского соединения если есть такой метод
-                if hasattr(self.shogun_client, 'disconnect'):
-                    self.shogun_client.disconnect()
-                elif hasattr(self.shogun_client, 'close'):
-                    self.shogun_client.close()
+                self._client_close()
             except Exception as e:
                 self.logger.debug(f"Ошибка при закрытии соединения: {e}")
         
@@ -257,6 +705,7 @@ class ShogunWorker(QThread):
         attempt = 0
         max_attempts = config.MAX_RECONNECT_ATTEMPTS
         base_delay = config.BASE_RECONNECT_DELAY
+        started = time.monotonic()
         
         while attempt < max_attempts and self.running:  # Проверяем self.running для возможности прервать
             result = await self.connect_shogun()
@@ -265,19 +714,37 @@ class ShogunWorker(QThread):
                 return True
             
             attempt += 1
-            # Экспоненциальная отсрочка с максимальным значением
+            # Экспоненциальная отсрочка с максимальным значением и случайным разбросом
             delay = min(base_delay * (1.5 ** (attempt - 1)), config.MAX_RECONNECT_DELAY)
+            delay *= random.uniform(0.5, 1.5)
+            if time.monotonic() - started + delay > config.MAX_RECONNECT_TIME:
+                break
             self.logger.debug(f"Попытка {attempt} не удалась. Следующая через {delay:.1f} секунд...")
             
-            # Разбиваем ожидание на короткие интервалы для возможности прерывания
-            for _ in range(int(delay * 10)):
-                if not self.running:
-                    return False
-                await asyncio.sleep(0.1)
+            # Ожидание прерывается сразу при остановке воркера
+            if await self._wait_stop(delay):
+                return False
         
-        self.logger.error(f"Не удалось переподключиться к Shogun Live после {max_attempts} попыток")
+        self.logger.error(f"Не удалось переподключиться к Shogun Live после {attempt} попыток "
+                          f"за {time.monotonic() - started:.1f} секунд")
         return False
     
+    async def _wait_stop(self, timeout: float) -> bool:
+        """
+        Ожидает остановки воркера не дольше указанного времени
+        
+        Args:
+            timeout: Максимальное время ожидания в секундах
+            
+        Returns:
+            bool: True если воркер остановлен, иначе False
+        """
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
     async def check_shogun(self) -> bool:
         """
         Проверка состояния записи
@@ -289,13 +756,28 @@ class ShogunWorker(QThread):
             if not self.capture:
                 return False
                 
-            status = str(self.capture.latest_capture_state())
-            is_recording = 'Started' in status
-            return is_recording
+            return self._is_recording_state(await self._call(self.capture.latest_capture_state))
         except Exception as e:
             self.logger.debug(f"Ошибка проверки состояния Shogun Live: {e}")
             return False
     
+    def _emit_error(self, msg: str) -> None:
+        """
+        Логирует ошибку записи и сообщает о ней в GUI
+        
+        Повтор того же сообщения в течение 5 секунд отбрасывается, чтобы
+        при длительном сбое GUI не заполнялся одинаковыми ошибками.
+        
+        Args:
+            msg: Текст ошибки
+        """
+        now = time.monotonic()
+        if msg == self._last_error_sig[0] and now - self._last_error_sig[1] < 5.0:
+            return
+        self._last_error_sig = (msg, now)
+        self.logger.error(msg)
+        self.capture_error_signal.emit(msg)
+    
     async def startcapture(self) -> Optional[Union[str, Dict]]:
         """
         Запуск записи
@@ -305,25 +787,24 @@ class ShogunWorker(QThread):
         """
         try:
             # Проверяем соединение перед операцией
-            if not await self.ensure_connection():
+            state = await self.ensure_connection()
+            if state is None:
                 error_msg = "Не удалось установить соединение с Shogun Live"
-                self.logger.error(error_msg)
-                self.capture_error_signal.emit(error_msg)
+                self._emit_error(error_msg)
                 return None
             
             # Проверяем, не идет ли уже запись
-            if await self.check_shogun():
+            if self._is_recording_state(state):
                 self.logger.info("Запись уже активна в Shogun Live")
                 return {"status": "already_recording"}
                 
             # Запускаем запись
-            result = self.capture.start_capture()
+            result = await self._call(self.capture.start_capture)
             
             # Проверяем результат запуска записи
             if not result:
                 error_msg = "Shogun Live отклонил запрос на запись"
-                self.logger.error(error_msg)
-                self.capture_error_signal.emit(error_msg)
+                self._emit_error(error_msg)
                 return None
                 
             self.logger.info("Запись начата в Shogun Live")
@@ -331,25 +812,22 @@ class ShogunWorker(QThread):
             
         except Exception as e:
             error_msg = f"Ошибка запуска записи: {e}"
-            self.logger.error(error_msg)
-            self.capture_error_signal.emit(error_msg)
+            self._emit_error(error_msg)
             
             # Пробуем переподключиться и повторить операцию
             if await self.reconnect_shogun():
                 try:
-                    result = self.capture.start_capture()
+                    result = await self._call(self.capture.start_capture)
                     if not result:
                         error_msg = "Shogun Live отклонил запрос на запись после переподключения"
-                        self.logger.error(error_msg)
-                        self.capture_error_signal.emit(error_msg)
+                        self._emit_error(error_msg)
                         return None
                         
                     self.logger.info("Запись начата в Shogun Live после переподключения")
                     return {"status": "started_after_reconnect"}
                 except Exception as e2:
                     error_msg = f"Не удалось запустить запись после переподключения: {e2}"
-                    self.logger.error(error_msg)
-                    self.capture_error_signal.emit(error_msg)
+                    self._emit_error(error_msg)
             return None
     
     async def stopcapture(self) -> bool:
@@ -361,47 +839,43 @@ class ShogunWorker(QThread):
         """
         try:
             # Проверяем соединение перед операцией
-            if not await self.ensure_connection():
+            state = await self.ensure_connection()
+            if state is None:
                 error_msg = "Не удалось установить соединение с Shogun Live"
-                self.logger.error(error_msg)
-                self.capture_error_signal.emit(error_msg)
+                self._emit_error(error_msg)
                 return False
             
             # Проверяем, идет ли запись
-            if not await self.check_shogun():
+            if not self._is_recording_state(state):
                 self.logger.info("Запись не активна в Shogun Live")
                 return True
                 
-            result = self.capture.stop_capture(0)
+            result = await self._call(self.capture.stop_capture, 0)
             if not result:
                 error_msg = "Shogun Live отклонил запрос на остановку записи"
-                self.logger.error(error_msg)
-                self.capture_error_signal.emit(error_msg)
+                self._emit_error(error_msg)
                 return False
                 
             self.logger.info("Запись остановлена в Shogun Live")
             return True
         except Exception as e:
             error_msg = f"Ошибка остановки записи: {e}"
-            self.logger.error(error_msg)
-            self.capture_error_signal.emit(error_msg)
+            self._emit_error(error_msg)
             
             # Пробуем переподключиться и повторить операцию
             if await self.reconnect_shogun():
                 try:
-                    result = self.capture.stop_capture(0)
+                    result = await self._call(self.capture.stop_capture, 0)
                     if not result:
                         error_msg = "Shogun Live отклонил запрос на остановку записи после переподключения"
-                        self.logger.error(error_msg)
-                        self.capture_error_signal.emit(error_msg)
+                        self._emit_error(error_msg)
                         return False
                         
                     self.logger.info("Запись остановлена в Shogun Live после переподключения")
                     return True
                 except Exception as e2:
                     error_msg = f"Не удалось остановить запись после переподключения: {e2}"
-                    self.logger.error(error_msg)
-                    self.capture_error_signal.emit(error_msg)
+                    self._emit_error(error_msg)
             return False
     
     async def set_capture_name(self, name: str) -> bool:
@@ -420,7 +894,7 @@ class ShogunWorker(QThread):
                 self.logger.error(error_msg)
                 return False
                 
-            result = self.capture.set_capture_name(name)
+            result = await self._call(self.capture.set_capture_name, name)
             if result:
                 self.logger.info(f"Имя захвата установлено: '{name}'")
                 self._current_capture_name = name
@@ -449,7 +923,7 @@ class ShogunWorker(QThread):
                 self.logger.error(error_msg)
                 return False
                 
-            result = self.capture.set_capture_folder(folder)
+            result = await self._call(self.capture.set_capture_folder, folder)
             if result:
                 self.logger.info(f"Папка захвата установлена: '{folder}'")
                 self._current_capture_folder = folder
@@ -479,8 +953,8 @@ class ShogunWorker(QThread):
                 return False
             
             # Проверяем, есть ли метод для установки описания (может отсутствовать в некоторых версиях API)
-            if hasattr(self.capture, 'set_capture_description'):
-                result = self.capture.set_capture_description(description)
+            if self._set_description:
+                result = await self._call(self._set_description, description)
                 if result:
                     self.logger.info(f"Описание захвата установлено")
                     self._current_capture_description = description
@@ -498,13 +972,13 @@ class ShogunWorker(QThread):
     
     def stop(self):
         """Остановка рабочего потока"""
-        self.running = False
-        # Закрываем соединение при остановке
-        if self.shogun_client:
+        loop = self.loop
+        if loop is not None and loop.is_running():
+            # Остановка и закрытие соединения выполняются в цикле событий воркера
             try:
-                if hasattr(self.shogun_client, 'disconnect'):
-                    self.shogun_client.disconnect()
-                elif hasattr(self.shogun_client, 'close'):
-                    self.shogun_client.close()
-            except Exception as e:
-                self.logger.debug(f"Ошибка при закрытии соединения: {e}")
+                loop.call_soon_threadsafe(self._request_stop)
+                return
+            except RuntimeError:
+                # Цикл событий уже закрыт
+                pass
+        self.running = False